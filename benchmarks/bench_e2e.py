@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+端到端续期基准：对本地模拟面板运行完整续期流程 (单账号 / 多账号)
+
+用法: python benchmarks/bench_e2e.py [--accounts 1,5] [--rounds 3] [--engine http] [--latency 0.05]
+                                   [--memory-profile low]
+报告每种场景的墙钟时间、峰值 RSS (浏览器引擎另有浏览器进程树峰值) 以及各阶段耗时 (来自状态存储中的运行记录)。
+在临时目录中运行，不会改动仓库里的 README.md / NEXT_RUN.md / 状态数据库。
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, ".."))
+sys.path.insert(0, BENCH_DIR)
+
+from mock_panel_server import MockPanel  # noqa: E402
+
+
+def peak_rss_mb() -> dict:
+    """本进程与已退出子进程 (浏览器) 的峰值 RSS (Linux 下 ru_maxrss 单位为 KB)"""
+    return {
+        "self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024,
+    }
+
+
+def summarize_phases(records) -> dict:
+    phases = {}
+    for record in records:
+        for phase, seconds in record["phases"].items():
+            phases.setdefault(phase, []).append(seconds)
+    return {phase: round(statistics.mean(values), 3) for phase, values in phases.items()}
+
+
+async def run_scenario(renewal, mock: MockPanel, count: int, rounds: int) -> dict:
+    accounts = [
+        renewal.Account(f"user{i}", "password", f"game{i}.example.jp", name=f"bench{i}" if count > 1 else None)
+        for i in range(count)
+    ]
+    store = renewal.state_store.get_store(renewal.Config.STATE_DB)
+    walls = []
+    statuses = {}
+    first_run_id = (store.history(limit=1) or [{"id": 0}])[0]["id"]
+    for _ in range(rounds):
+        mock.reset()
+        started = time.perf_counter()
+        if count == 1:
+            runner = renewal.XServerGamePanelRenewal(accounts[0])
+            await runner.run(skip_check=True)
+            results = [runner.result()]
+        else:
+            results = await renewal.FleetRenewal(accounts).run(force=True)
+        walls.append(time.perf_counter() - started)
+        for result in results:
+            statuses[result["status"]] = statuses.get(result["status"], 0) + 1
+
+    records = [
+        json.loads(r["record"]) for r in store.history(limit=count * rounds)
+        if r["id"] > first_run_id and r["record"]
+    ]
+    return {
+        "accounts": count,
+        "rounds": rounds,
+        "wall_mean": round(statistics.mean(walls), 3),
+        "wall_min": round(min(walls), 3),
+        "per_account": round(statistics.mean(walls) / count, 3),
+        "statuses": statuses,
+        "phases": summarize_phases(records),
+        "navigations": sum(r["navigations"] for r in records) / max(len(records), 1),
+        "peak_rss_mb": peak_rss_mb(),
+        "browser_peak_rss_mb": max((r["browser_peak_rss_mb"] for r in records if r.get("browser_peak_rss_mb")),
+                                   default=None),
+    }
+
+
+async def main_async(args):
+    mock = MockPanel(
+        remaining_hours=args.remaining_hours,
+        latency=args.latency,
+        jitter=args.jitter,
+        fail_rate=args.fail_rate,
+        challenge_rate=args.challenge_rate,
+        same_url_confirm=args.same_url_confirm,
+        seed=1,
+    )
+    login_url = await mock.start()
+
+    # Config 在导入时读取环境变量，必须先设置再导入
+    workdir = tempfile.mkdtemp(prefix="xserver-bench-")
+    os.chdir(workdir)
+    os.environ.update({
+        "GAME_LOGIN_URL": login_url,
+        "RENEWAL_ENGINE": args.engine,
+        "WAIT_PROFILE": "fast",
+        "STATE_DB": os.path.join(workdir, "state.db"),
+        "MAX_CONCURRENCY": str(args.concurrency),
+        "MEMORY_PROFILE": args.memory_profile,
+    })
+    os.environ.pop("SESSION_SECRET", None)
+    import xserver_game_panel_renewal as renewal
+    renewal.setup_logging(level="INFO" if args.verbose else "WARNING")
+
+    print(f"🧪 模拟面板: {login_url} (延迟 {args.latency}s, 故障率 {args.fail_rate}), 引擎: {args.engine}")
+    print(f"📁 工作目录: {workdir}")
+    reports = []
+    try:
+        for count in args.accounts:
+            report = await run_scenario(renewal, mock, count, args.rounds)
+            reports.append(report)
+            print(
+                f"⏱️ {count} 个账号 × {args.rounds} 轮: 平均 {report['wall_mean']}s "
+                f"(最快 {report['wall_min']}s, 每账号 {report['per_account']}s), "
+                f"峰值 RSS {report['peak_rss_mb']['self']:.0f} MB "
+                f"(子进程 {report['peak_rss_mb']['children']:.0f} MB), 状态 {report['statuses']}"
+            )
+            if report["browser_peak_rss_mb"] is not None:
+                print(f"    浏览器峰值 RSS {report['browser_peak_rss_mb']:.0f} MB ({args.memory_profile})")
+            for phase, seconds in report["phases"].items():
+                print(f"    {phase:<22} {seconds:.3f}s")
+    finally:
+        await renewal.Notifier.close()
+        renewal.state_store.close_all()
+        await mock.stop()
+
+    print(f"📊 模拟面板请求统计: {mock.stats}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(reports, f, ensure_ascii=False, indent=2)
+        print(f"💾 结果已写入 {args.json}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--accounts", default="1,5", help="逗号分隔的账号数量场景")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--engine", default="http", choices=["auto", "http", "browser"])
+    parser.add_argument("--concurrency", type=int, default=3)
+    parser.add_argument("--memory-profile", default="default", choices=["default", "low"])
+    parser.add_argument("--remaining-hours", type=float, default=10)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--challenge-rate", type=float, default=0.0)
+    parser.add_argument("--same-url-confirm", action="store_true", help="模拟面板的最终确认提交回同一 URL")
+    parser.add_argument("--json", help="把结果写入 JSON 文件")
+    parser.add_argument("--verbose", action="store_true", help="输出续期脚本日志")
+    args = parser.parse_args()
+    args.accounts = [int(n) for n in args.accounts.split(",")]
+    if args.json:
+        args.json = os.path.abspath(args.json)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+到期时间解析基准：离线校验样本库的正确性，并测量解析吞吐量
+
+用法: python benchmarks/bench_expiry_parser.py [--corpus PATH] [--rounds N]
+samples 校验 parse_expiry；page_samples 校验整页文本查找 find_expiry_text (例如登录时间不能被当作到期时间)。
+有样本解析错误时退出码为 1，可作为新增面板格式的回归检查。
+"""
+
+import argparse
+import datetime
+import html
+import json
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import expiry_parser  # noqa: E402
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "expiry_corpus.json")
+
+TAG_RE = re.compile(r"<[^>]+>")
+
+# 旧实现: 四个正则依次 search (用于对比)
+LEGACY_PATTERNS = [
+    re.compile(r'(\d{4})年(\d{2})月(\d{2})日\s+(\d{2}):(\d{2})'),
+    re.compile(r'\((\d{4})-(\d{2})-(\d{2})まで\)'),
+    re.compile(r'あと\s+(\d+)日\s+(\d+)時間'),
+    re.compile(r'残り(\d+)時間(\d+)分'),
+]
+
+
+def html_to_text(fragment: str) -> str:
+    return html.unescape(TAG_RE.sub("", fragment))
+
+
+def legacy_parse(text: str):
+    for pattern in LEGACY_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return match
+    return None
+
+
+def check_corpus(samples, now) -> int:
+    failures = 0
+    for sample in samples:
+        result = expiry_parser.parse_expiry(html_to_text(sample["html"]), now)
+        got_format = result.format if result else None
+        got_expiry = result.expiry.strftime("%Y-%m-%d %H:%M") if result else None
+        ok = got_format == sample["format"] and got_expiry == sample["expiry"]
+        if not ok:
+            failures += 1
+        print(f"{'✅' if ok else '❌'} {sample['name']}: {got_format} {got_expiry}"
+              + ("" if ok else f" (期望 {sample['format']} {sample['expiry']})"))
+    return failures
+
+
+def check_page_corpus(samples, now) -> int:
+    """整页文本：find_expiry_text 找到的片段及其解析结果"""
+    failures = 0
+    for sample in samples:
+        found = expiry_parser.find_expiry_text(html_to_text(sample["html"]))
+        result = expiry_parser.parse_expiry(found, now) if found else None
+        got_format = result.format if result else None
+        got_expiry = result.expiry.strftime("%Y-%m-%d %H:%M") if result else None
+        ok = found == sample["text"] and got_format == sample["format"] and got_expiry == sample["expiry"]
+        if not ok:
+            failures += 1
+        print(f"{'✅' if ok else '❌'} [整页] {sample['name']}: {found!r} {got_expiry}"
+              + ("" if ok else f" (期望 {sample['text']!r} {sample['expiry']})"))
+    return failures
+
+
+def throughput(func, texts, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for text in texts:
+            func(text)
+    elapsed = time.perf_counter() - started
+    return rounds * len(texts) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--rounds", type=int, default=20000)
+    args = parser.parse_args()
+
+    with open(args.corpus, "r", encoding="utf-8") as f:
+        corpus = json.load(f)
+    now = datetime.datetime.fromisoformat(corpus["now"])
+    samples = corpus["samples"]
+    page_samples = corpus.get("page_samples", [])
+
+    print(f"📋 样本 {len(samples)} + 整页样本 {len(page_samples)} 个, "
+          f"已注册格式: {[f.name for f in expiry_parser.formats()]}")
+    failures = check_corpus(samples, now) + check_page_corpus(page_samples, now)
+
+    texts = [html_to_text(s["html"]) for s in samples]
+    parse = throughput(lambda t: expiry_parser.parse_expiry(t, now), texts, args.rounds)
+    combined = throughput(expiry_parser.find_expiry_text, texts, args.rounds)
+    legacy = throughput(legacy_parse, texts, args.rounds)
+    print(f"⚡ parse_expiry (匹配 + 计算到期时间): {parse:,.0f} 次/秒")
+    print(f"🔎 合并正则仅匹配: {combined:,.0f} 次/秒")
+    print(f"🔎 旧版四个正则依次匹配: {legacy:,.0f} 次/秒")
+    total = len(samples) + len(page_samples)
+    print(f"{'✅' if not failures else '❌'} 正确 {total - failures}/{total}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+本地模拟 XServer Game Panel (aiohttp)，用于端到端测试与基准
+
+- 登录表单字段与真实页面一致: username / server_password / server_identify / action_user_login
+- 面板页 span.ttlTxt 按账号轮流使用 expiry_parser 支持的各种格式
+- 面板页带「アップグレード・期限延長」链接，之后经过「確認画面に進む」→「期限を延長する」
+  两步表单确认，完成页显示「期限を延長しました」，到期时间延长 EXTEND_HOURS
+- same_url_confirm: 「期限を延長する」表单提交回确认页自身的 URL (POST-back)，而不是单独的完成 URL
+- 登录页与真实页面一样带 <noscript> 的「JavaScriptを有効に」提示 (不应被当作验证页面)
+- 可配置响应延迟与故障注入 (HTTP 500 / 验证页面)
+
+用法: python benchmarks/mock_panel_server.py [--port 8765] [--latency 0.2] [--fail-rate 0.1]
+然后设置 GAME_LOGIN_URL=http://127.0.0.1:8765/xapanel/login/xmgame/game/ 运行续期脚本。
+"""
+
+import argparse
+import asyncio
+import datetime
+import random
+import secrets
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from aiohttp import web
+
+JST = datetime.timezone(timedelta(hours=9))
+
+LOGIN_PATH = "/xapanel/login/xmgame/game/"
+PANEL_PATH = "/xmgame/game/index"
+EXTEND_PATH = "/xmgame/game/freeplan/extend/index"
+EXTEND_CONF_PATH = "/xmgame/game/freeplan/extend/conf"
+EXTEND_DO_PATH = "/xmgame/game/freeplan/extend/do"
+
+FORMATS = ("date", "date_iso", "remain", "remain_hours")
+EXTEND_HOURS = 72
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html lang="ja"><head><meta charset="utf-8"><title>ログイン | XServer GAMEs</title></head>
+<body>
+<noscript><p>このページを正しく表示するには、ブラウザのJavaScriptを有効にしてください。
+Please enable JavaScript in your browser.</p></noscript>
+<form action="{action}" method="post">
+  <input type="hidden" name="csrf_token" value="{token}">
+  <label>ログインID <input type="text" name="username" id="username"></label>
+  <label>ゲームパネルパスワード <input type="password" name="server_password" id="server_password"></label>
+  <label>ご利用中のドメイン または IPアドレス <input type="text" name="server_identify" id="server_identify"></label>
+  {error}
+  <input type="submit" name="action_user_login" value="ログインする">
+</form>
+</body></html>
+"""
+
+PANEL_PAGE = """<!DOCTYPE html>
+<html lang="ja"><head><meta charset="utf-8"><title>ゲームパネル | XServer GAMEs</title></head>
+<body>
+<h1>ゲームパネル</h1>
+<div class="contract">
+  <p>利用期限: <span class="ttlTxt">{ttl}</span></p>
+  <a href="{extend}" class="btn">アップグレード・期限延長</a>
+</div>
+</body></html>
+"""
+
+EXTEND_PAGE = """<!DOCTYPE html>
+<html lang="ja"><head><meta charset="utf-8"><title>期限延長 | XServer GAMEs</title></head>
+<body>
+<h1>期限延長</h1>
+<p>無料プランの利用期限を{hours}時間延長できます。</p>
+<form action="{action}" method="post">
+  <input type="hidden" name="csrf_token" value="{token}">
+  <button type="submit">確認画面に進む</button>
+</form>
+</body></html>
+"""
+
+EXTEND_CONF_PAGE = """<!DOCTYPE html>
+<html lang="ja"><head><meta charset="utf-8"><title>期限延長 確認 | XServer GAMEs</title></head>
+<body>
+<h1>確認</h1>
+<p>利用期限を延長します。よろしいですか？</p>
+<form action="{action}" method="post">
+  <input type="hidden" name="csrf_token" value="{token}">
+  <button type="submit" name="execute" value="1">期限を延長する</button>
+</form>
+</body></html>
+"""
+
+EXTEND_DONE_PAGE = """<!DOCTYPE html>
+<html lang="ja"><head><meta charset="utf-8"><title>期限延長 完了 | XServer GAMEs</title></head>
+<body><p>期限を延長しました。</p><a href="{panel}">ゲームパネルへ戻る</a></body></html>
+"""
+
+CHALLENGE_PAGE = """<!DOCTYPE html>
+<html><head><title>Just a moment...</title></head>
+<body><div class="cf-challenge">Checking your browser</div></body></html>
+"""
+
+
+def format_ttl(fmt: str, expiry: datetime.datetime, now: datetime.datetime) -> str:
+    """按面板格式渲染到期时间 (与 benchmarks/fixtures/expiry_corpus.json 中的样本一致)"""
+    remaining = max(expiry - now, timedelta())
+    hours = int(remaining.total_seconds() // 3600)
+    minutes = int(remaining.total_seconds() % 3600 // 60)
+    if fmt == "date":
+        return f"{expiry:%Y年%m月%d日 %H:%M}まで"
+    if fmt == "date_iso":
+        return f"({expiry:%Y-%m-%d}まで)"
+    if fmt == "remain":
+        return f"あと {hours // 24}日 {hours % 24}時間"
+    return f"残り<b>{hours}</b>時間{minutes}分"
+
+
+class MockPanel:
+    """模拟面板：每个账号 (按 server_identify 区分) 有独立的到期时间与格式"""
+
+    def __init__(self, remaining_hours: float = 10, formats: Optional[List[str]] = None,
+                 latency: float = 0.0, jitter: float = 0.0,
+                 fail_rate: float = 0.0, challenge_rate: float = 0.0, seed: Optional[int] = None,
+                 same_url_confirm: bool = False):
+        self.remaining_hours = remaining_hours
+        self.formats = list(formats or FORMATS)
+        self.latency = latency
+        self.jitter = jitter
+        self.fail_rate = fail_rate
+        self.challenge_rate = challenge_rate
+        self.same_url_confirm = same_url_confirm
+        self.random = random.Random(seed)
+        self.accounts: Dict[str, Dict] = {}
+        self.sessions: Dict[str, str] = {}
+        self.stats = {"requests": 0, "logins": 0, "extends": 0, "failures": 0, "challenges": 0}
+        self._runner: Optional[web.AppRunner] = None
+        self.base_url: Optional[str] = None
+
+    # ---------- 状态 ----------
+    def account(self, domain: str) -> Dict:
+        if domain not in self.accounts:
+            self.accounts[domain] = {
+                "format": self.formats[len(self.accounts) % len(self.formats)],
+                "expiry": datetime.datetime.now(JST) + timedelta(hours=self.remaining_hours),
+                "extends": 0,
+            }
+        return self.accounts[domain]
+
+    def reset(self):
+        """清空账号与会话 (基准的每一轮从相同状态开始)"""
+        self.accounts.clear()
+        self.sessions.clear()
+
+    # ---------- 中间件: 延迟 + 故障注入 ----------
+    @web.middleware
+    async def _inject(self, request: web.Request, handler):
+        self.stats["requests"] += 1
+        delay = self.latency + self.random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        roll = self.random.random()
+        if roll < self.fail_rate:
+            self.stats["failures"] += 1
+            return web.Response(status=500, text="Internal Server Error")
+        if roll < self.fail_rate + self.challenge_rate:
+            self.stats["challenges"] += 1
+            return web.Response(text=CHALLENGE_PAGE, content_type="text/html")
+        return await handler(request)
+
+    # ---------- 页面 ----------
+    def _login_page(self, error: str = "") -> web.Response:
+        body = LOGIN_PAGE.format(action=LOGIN_PATH, token=secrets.token_hex(8), error=error)
+        return web.Response(text=body, content_type="text/html")
+
+    async def login_get(self, request: web.Request):
+        return self._login_page()
+
+    async def login_post(self, request: web.Request):
+        data = await request.post()
+        if not (data.get("csrf_token") and data.get("username") and data.get("server_password")
+                and data.get("server_identify")):
+            return self._login_page('<p class="error">ログインに失敗しました</p>')
+        self.stats["logins"] += 1
+        sid = secrets.token_hex(16)
+        self.sessions[sid] = data["server_identify"]
+        response = web.HTTPFound(PANEL_PATH)
+        response.set_cookie("XSERVER_SID", sid, httponly=True)
+        raise response
+
+    def _domain(self, request: web.Request) -> str:
+        domain = self.sessions.get(request.cookies.get("XSERVER_SID", ""))
+        if domain is None:
+            raise web.HTTPFound(LOGIN_PATH)
+        return domain
+
+    async def panel(self, request: web.Request):
+        state = self.account(self._domain(request))
+        ttl = format_ttl(state["format"], state["expiry"], datetime.datetime.now(JST))
+        return web.Response(text=PANEL_PAGE.format(ttl=ttl, extend=EXTEND_PATH), content_type="text/html")
+
+    def _extend_token(self, request: web.Request) -> str:
+        state = self.account(self._domain(request))
+        state["token"] = secrets.token_hex(8)
+        return state["token"]
+
+    async def _check_token(self, request: web.Request) -> Dict:
+        state = self.account(self._domain(request))
+        data = await request.post()
+        if not state.get("token") or data.get("csrf_token") != state["token"]:
+            raise web.HTTPBadRequest(text="invalid token")
+        return state
+
+    async def extend(self, request: web.Request):
+        page = EXTEND_PAGE.format(hours=EXTEND_HOURS, action=EXTEND_CONF_PATH, token=self._extend_token(request))
+        return web.Response(text=page, content_type="text/html")
+
+    async def extend_conf(self, request: web.Request):
+        if self.same_url_confirm and (await request.post()).get("execute"):
+            return await self.extend_do(request)
+        await self._check_token(request)
+        action = EXTEND_CONF_PATH if self.same_url_confirm else EXTEND_DO_PATH
+        page = EXTEND_CONF_PAGE.format(action=action, token=self._extend_token(request))
+        return web.Response(text=page, content_type="text/html")
+
+    async def extend_do(self, request: web.Request):
+        state = await self._check_token(request)
+        state["token"] = None  # 防止重复提交
+        state["expiry"] += timedelta(hours=EXTEND_HOURS)
+        state["extends"] += 1
+        self.stats["extends"] += 1
+        return web.Response(text=EXTEND_DONE_PAGE.format(panel=PANEL_PATH), content_type="text/html")
+
+    # ---------- 启停 ----------
+    def make_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._inject])
+        app.router.add_get(LOGIN_PATH, self.login_get)
+        app.router.add_post(LOGIN_PATH, self.login_post)
+        app.router.add_get(PANEL_PATH, self.panel)
+        app.router.add_get(EXTEND_PATH, self.extend)
+        app.router.add_post(EXTEND_CONF_PATH, self.extend_conf)
+        app.router.add_post(EXTEND_DO_PATH, self.extend_do)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """启动服务器，返回登录页 URL (port=0 时自动选择空闲端口)"""
+        self._runner = web.AppRunner(self.make_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.base_url = f"http://{host}:{port}"
+        return self.base_url + LOGIN_PATH
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+async def serve(args):
+    mock = MockPanel(
+        remaining_hours=args.remaining_hours,
+        formats=args.formats.split(",") if args.formats else None,
+        latency=args.latency,
+        jitter=args.jitter,
+        fail_rate=args.fail_rate,
+        challenge_rate=args.challenge_rate,
+        same_url_confirm=args.same_url_confirm,
+    )
+    login_url = await mock.start(args.host, args.port)
+    print(f"🧪 模拟面板已启动: GAME_LOGIN_URL={login_url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await mock.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="本地模拟 XServer Game Panel")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--remaining-hours", type=float, default=10, help="新账号的剩余时间 (小时)")
+    parser.add_argument("--formats", help=f"逗号分隔的到期时间格式，默认 {','.join(FORMATS)}")
+    parser.add_argument("--latency", type=float, default=0.0, help="每个响应的固定延迟 (秒)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="额外随机延迟上限 (秒)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="返回 HTTP 500 的概率")
+    parser.add_argument("--challenge-rate", type=float, default=0.0, help="返回验证页面的概率")
+    parser.add_argument("--same-url-confirm", action="store_true", help="最终确认表单提交回确认页自身的 URL")
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+命令行入口 (子命令)
+
+    python cli.py status [--json]               各账号当前状态；有账号上次失败时退出码为 1
+    python cli.py due [--within 60] [--json]    已到期 (或 N 分钟内到期) 的账号；有到期账号时退出码为 0
+    python cli.py check                         按计划运行，只检查到期账号 (cron 默认行为)
+    python cli.py renew [--account KEY ...]     立即检查，忽略下次检查时间
+    python cli.py daemon [--supervise-browser]  常驻调度 / 托管持久 Chromium
+    python cli.py bench [bench_e2e 参数 ...]     端到端基准 (benchmarks/bench_e2e.py)
+
+status / due 只依赖标准库与 state_store，不导入 asyncio / aiohttp / Playwright，也不配置日志文件，
+适合 shell 脚本与监控探针。其余子命令才导入 xserver_game_panel_renewal。
+不带子命令时等同 check；旧参数 --daemon / --supervise-browser 仍然有效。
+"""
+
+import argparse
+import datetime
+import json
+import os
+import sys
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+import state_store
+
+COMMANDS = ("status", "due", "check", "renew", "daemon", "bench")
+
+# 与 Config.TRIGGER_HOUR 相同的环境变量 (不为此导入主模块)
+TRIGGER_HOUR = int(os.getenv("TRIGGER_HOUR", "23"))
+
+
+# ======================== 只读查询 ==========================
+
+def _open_store() -> Optional[state_store.StateStore]:
+    """状态数据库不存在时返回 None (只读查询不创建空数据库)"""
+    if not os.path.exists(state_store.DEFAULT_PATH):
+        print(f"ℹ️ 状态数据库不存在: {state_store.DEFAULT_PATH} (请先运行一次续期)", file=sys.stderr)
+        return None
+    return state_store.get_store()
+
+
+def _select(rows: List[Dict], accounts: Optional[List[str]]) -> List[Dict]:
+    return [row for row in rows if not accounts or row["account"] in accounts]
+
+
+def cmd_status(args) -> int:
+    store = _open_store()
+    if store is None:
+        return 1
+    rows = _select(store.accounts(), args.account)
+    fields = ("account", "status", "expiry_time", "next_check_time", "last_check", "error")
+    if args.json:
+        print(json.dumps([{f: row.get(f) for f in fields} for row in rows], ensure_ascii=False, indent=2))
+    else:
+        for row in rows:
+            print(
+                f"{row['account']:<20} {row['status'] or 'Unknown':<10} "
+                f"到期 {row['expiry_time'] or '未知':<16} 下次检查 {row['next_check_time'] or '未知':<16}"
+                + (f" 错误: {row['error']}" if row["error"] else "")
+            )
+    return 1 if any(row["status"] == "Failed" for row in rows) else 0
+
+
+def cmd_due(args) -> int:
+    store = _open_store()
+    if store is None:
+        return 1
+    now = datetime.datetime.now(state_store.JST)
+    horizon = now + timedelta(minutes=args.within)
+    due = []
+    # due_before 按 next_check_ts 预筛 (due_time 不会早于存储的下次检查时间，只会因 Unexpired 推迟)
+    for row in _select(store.due_before(horizon), args.account):
+        when = state_store.due_time(row, now, TRIGGER_HOUR)
+        if when <= horizon:
+            due.append({"account": row["account"], "due": when.strftime(state_store.TIME_FORMAT),
+                        "status": row["status"], "expiry_time": row["expiry_time"]})
+    due.sort(key=lambda item: item["due"])
+    if args.json:
+        print(json.dumps(due, ensure_ascii=False, indent=2))
+    else:
+        for item in due:
+            print(f"{item['account']:<20} {item['due']} (JST)  到期 {item['expiry_time'] or '未知'}")
+    return 0 if due else 1
+
+
+# ======================== 运行 ==========================
+
+def cmd_run(args, renewal=None) -> int:
+    """check / renew / daemon：导入主模块并运行"""
+    import asyncio
+
+    if renewal is None:
+        import xserver_game_panel_renewal as renewal
+    renewal.setup_logging()
+    command = "supervise-browser" if getattr(args, "supervise_browser", False) else args.command
+    try:
+        asyncio.run(renewal.main(command, getattr(args, "account", None)))
+    except ValueError as e:
+        # 账号配置错误 (未知账号 / 账号标识重复)
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    return 0
+
+
+def cmd_bench(args) -> int:
+    """把剩余参数交给 benchmarks/bench_e2e.py (它在设置好环境变量后才导入主模块)"""
+    import runpy
+
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "bench_e2e.py")
+    sys.argv = [path, *args.bench_args]
+    runpy.run_path(path, run_name="__main__")
+    return 0
+
+
+# ======================== 参数解析 ==========================
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="XServer Game Panel 自动续期")
+    # 兼容旧的调用方式
+    parser.add_argument("--daemon", action="store_true", help="同 daemon 子命令")
+    parser.add_argument("--supervise-browser", action="store_true",
+                        help="托管一个持久 Chromium (配合 BROWSER_CDP_URL 使用)")
+    sub = parser.add_subparsers(dest="command", metavar="{" + ",".join(COMMANDS) + "}")
+
+    status = sub.add_parser("status", help="各账号当前状态 (只读)")
+    due = sub.add_parser("due", help="已到期的账号 (只读)")
+    due.add_argument("--within", type=float, default=0, help="包括 N 分钟内到期的账号")
+    for query in (status, due):
+        query.add_argument("--json", action="store_true", help="输出 JSON")
+        query.add_argument("--account", action="append", help="只显示指定账号 (可重复)")
+
+    sub.add_parser("check", help="按计划运行，只检查到期账号")
+    renew = sub.add_parser("renew", help="立即检查 (忽略下次检查时间)，进入续期窗口时续期")
+    renew.add_argument("--account", action="append", help="只运行指定账号 (可重复)，默认全部")
+    daemon = sub.add_parser("daemon", help="常驻运行，按下次检查时间精确调度")
+    daemon.add_argument("--supervise-browser", action="store_true", default=argparse.SUPPRESS,
+                        help="改为托管持久 Chromium")
+    bench = sub.add_parser("bench", help="端到端基准 (参数传给 benchmarks/bench_e2e.py)", add_help=False)
+    bench.add_argument("bench_args", nargs=argparse.REMAINDER)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None, renewal=None) -> int:
+    """renewal: 已导入的主模块 (从 xserver_game_panel_renewal.py 启动时传入)"""
+    parser = build_parser()
+    # bench 的参数原样交给 bench_e2e.py (REMAINDER 收不到以 -- 开头的参数)
+    args, extra = parser.parse_known_args(argv)
+    if args.command == "bench":
+        args.bench_args = extra + args.bench_args
+    elif extra:
+        parser.error(f"无法识别的参数: {' '.join(extra)}")
+    if args.command is None:
+        args.command = "daemon" if args.daemon else "check"
+
+    if args.command == "status":
+        return cmd_status(args)
+    if args.command == "due":
+        return cmd_due(args)
+    if args.command == "bench":
+        return cmd_bench(args)
+    return cmd_run(args, renewal)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
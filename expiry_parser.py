@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+XServer Game Panel 到期时间解析 (纯 Python，不依赖 Playwright)
+
+所有面板格式登记在格式表中，合并成一个编译好的正则，一次扫描即可识别。
+解析 ttlTxt 等到期时间元素时按格式优先级取匹配；在整页文本中查找时使用更严格的
+page_pattern (绝对日期必须带「まで」，避免匹配到登录时间等无关日期)，并取最靠前的匹配。
+新增格式只需调用 register_format()，并在 benchmarks/fixtures/expiry_corpus.json
+中补充样本，用 benchmarks/bench_expiry_parser.py 做回归检查。
+"""
+
+import datetime
+import re
+from datetime import timedelta
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+JST = datetime.timezone(timedelta(hours=9))
+
+# build(groups, now) -> 到期时间 (JST)
+Builder = Callable[[Dict[str, str], datetime.datetime], datetime.datetime]
+
+
+class ExpiryFormat(NamedTuple):
+    name: str
+    pattern: str
+    build: Builder
+    relative: bool  # 相对时间 (依赖当前时间)
+    example: str
+    page_pattern: Optional[str] = None  # 整页文本查找用的正则，默认与 pattern 相同
+
+
+class ExpiryResult(NamedTuple):
+    format: str
+    text: str
+    expiry: datetime.datetime
+    relative: bool
+
+
+_FORMATS: List[ExpiryFormat] = []
+_COMBINED: Optional["re.Pattern"] = None
+_PAGE_COMBINED: Optional["re.Pattern"] = None
+_RANKS: Dict[str, int] = {}
+
+
+def register_format(name: str, pattern: str, build: Builder, relative: bool = False, example: str = "",
+                    page_pattern: Optional[str] = None):
+    """登记一种到期时间格式；注册顺序即优先级 (同一文本匹配多种格式时取先注册的)
+
+    pattern 中的命名分组会自动加上格式名前缀，各格式可以使用相同的分组名。
+    page_pattern: 在整页文本中查找时使用的更严格正则 (可选)。
+    """
+    global _COMBINED, _PAGE_COMBINED
+    if any(f.name == name for f in _FORMATS):
+        raise ValueError(f"格式已存在: {name}")
+    _FORMATS.append(ExpiryFormat(name, pattern, build, relative, example, page_pattern))
+    _COMBINED = None
+    _PAGE_COMBINED = None
+
+
+def formats() -> List[ExpiryFormat]:
+    return list(_FORMATS)
+
+
+def _namespaced(fmt: ExpiryFormat, pattern: Optional[str] = None) -> str:
+    inner = re.sub(r'\(\?P<(\w+)>', rf'(?P<{fmt.name}__\1>', pattern or fmt.pattern)
+    return f'(?P<{fmt.name}>{inner})'
+
+
+def combined_pattern() -> "re.Pattern":
+    global _COMBINED
+    if _COMBINED is None:
+        _COMBINED = re.compile("|".join(_namespaced(f) for f in _FORMATS))
+        _RANKS.clear()
+        _RANKS.update({f.name: i for i, f in enumerate(_FORMATS)})
+    return _COMBINED
+
+
+def page_pattern() -> "re.Pattern":
+    """整页文本查找用的合并正则"""
+    global _PAGE_COMBINED
+    if _PAGE_COMBINED is None:
+        _PAGE_COMBINED = re.compile("|".join(_namespaced(f, f.page_pattern) for f in _FORMATS))
+    return _PAGE_COMBINED
+
+
+def _best_match(text: str):
+    best = None
+    best_rank = len(_FORMATS)
+    for match in combined_pattern().finditer(text):
+        rank = _RANKS[match.lastgroup]
+        if rank < best_rank:
+            best, best_rank = match, rank
+            if rank == 0:
+                break
+    return best
+
+
+def find_expiry_text(text: str) -> Optional[str]:
+    """从整页文本中找出到期时间片段 (最靠前的匹配，绝对日期必须带「まで」)"""
+    match = page_pattern().search(text)
+    return match.group(0) if match else None
+
+
+def parse_expiry(text: str, now: Optional[datetime.datetime] = None) -> Optional[ExpiryResult]:
+    """解析到期时间文本，无法识别时返回 None"""
+    match = _best_match(text)
+    if not match:
+        return None
+    fmt = _FORMATS[_RANKS[match.lastgroup]]
+    prefix = f"{fmt.name}__"
+    groups = {k[len(prefix):]: v for k, v in match.groupdict().items() if k.startswith(prefix)}
+    now = now or datetime.datetime.now(JST)
+    return ExpiryResult(fmt.name, match.group(0), fmt.build(groups, now), fmt.relative)
+
+
+# ======================== 内置格式 ==========================
+
+def _absolute(g: Dict[str, str], now: datetime.datetime) -> datetime.datetime:
+    return datetime.datetime(
+        int(g["year"]), int(g["month"]), int(g["day"]),
+        int(g.get("hour") or 23), int(g.get("minute") or 59), tzinfo=JST,
+    )
+
+
+# "2024年02月15日 23:59まで"
+register_format(
+    "date",
+    r'(?P<year>\d{4})年(?P<month>\d{2})月(?P<day>\d{2})日\s+(?P<hour>\d{2}):(?P<minute>\d{2})',
+    _absolute,
+    example="2024年02月15日 23:59まで",
+    page_pattern=r'(?P<year>\d{4})年(?P<month>\d{2})月(?P<day>\d{2})日\s+(?P<hour>\d{2}):(?P<minute>\d{2})まで',
+)
+
+# "(2026-02-14まで)" - 只有日期时按当天 23:59 计算
+register_format(
+    "date_iso",
+    r'\((?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})まで\)',
+    _absolute,
+    example="(2026-02-14まで)",
+)
+
+# "あと 2日 5時間"
+register_format(
+    "remain",
+    r'あと\s+(?P<days>\d+)日\s+(?P<hours>\d+)時間',
+    lambda g, now: now + timedelta(hours=int(g["days"]) * 24 + int(g["hours"])),
+    relative=True,
+    example="あと 2日 5時間",
+)
+
+# "残り64時間23分"
+register_format(
+    "remain_hours",
+    r'残り(?P<hours>\d+)時間(?P<minutes>\d+)分',
+    lambda g, now: now + timedelta(hours=int(g["hours"]), minutes=int(g["minutes"])),
+    relative=True,
+    example="残り64時間23分",
+)
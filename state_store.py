@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+续期状态存储 (SQLite, WAL 模式)
+
+每个账号一行当前状态 (到期时间、下次检查时间、状态、选择器统计等)，
+另有完整的运行历史。NEXT_RUN.md / README.md 只是这里数据的渲染结果。
+只依赖标准库，状态查询无需加载 Playwright。
+"""
+
+import datetime
+import json
+import os
+import sqlite3
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+JST = datetime.timezone(timedelta(hours=9))
+TIME_FORMAT = "%Y-%m-%d %H:%M"
+
+DEFAULT_PATH = os.getenv("STATE_DB", "game_panel_state.db")
+
+# 账号表的固定列，其余字段存入 extras (JSON)
+COLUMNS = ("expiry_time", "next_check_time", "status", "error", "last_check")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS accounts (
+    account TEXT PRIMARY KEY,
+    expiry_time TEXT,
+    next_check_time TEXT,
+    next_check_ts REAL,
+    status TEXT,
+    error TEXT,
+    last_check TEXT,
+    extras TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS idx_accounts_next_check ON accounts (next_check_ts);
+
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    account TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    status TEXT,
+    expiry_time TEXT,
+    next_check_time TEXT,
+    error TEXT,
+    record TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_account ON runs (account, started_at);
+"""
+
+
+def parse_time(value: Optional[str]) -> Optional[datetime.datetime]:
+    """"YYYY-MM-DD HH:MM" (JST) -> datetime"""
+    if not value:
+        return None
+    try:
+        return datetime.datetime.strptime(value, TIME_FORMAT).replace(tzinfo=JST)
+    except ValueError:
+        return None
+
+
+def to_timestamp(value: Optional[str]) -> Optional[float]:
+    """"YYYY-MM-DD HH:MM" (JST) -> epoch 秒"""
+    parsed = parse_time(value)
+    return parsed.timestamp() if parsed else None
+
+
+def due_time(state: Dict, now: datetime.datetime, trigger_hour: int,
+             margin: timedelta = timedelta()) -> datetime.datetime:
+    """按存储的状态计算账号下次应检查的时间 (调度器与命令行共用)
+
+    没有下次检查时间时按到期时间 - 24h 推算，都没有则立即检查；
+    上次检查为 Unexpired 且已过检查时间时，等到剩余时间 < trigger_hour 再检查。
+    """
+    expiry = parse_time(state.get("expiry_time"))
+    next_check = parse_time(state.get("next_check_time"))
+    if next_check is None and expiry is not None:
+        next_check = expiry - timedelta(hours=24)
+    due = next_check - margin if next_check else now
+    if due <= now and expiry and state.get("status") == "Unexpired":
+        due = expiry - timedelta(hours=trigger_hour) + timedelta(minutes=1)
+    return due
+
+
+class StateStore:
+    def __init__(self, path: str = DEFAULT_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=10, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    # ---------- 账号状态 ----------
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> Dict:
+        data = {"account": row["account"]}
+        data.update({c: row[c] for c in COLUMNS})
+        data.update(json.loads(row["extras"] or "{}"))
+        return data
+
+    def get(self, account: str) -> Optional[Dict]:
+        row = self.conn.execute("SELECT * FROM accounts WHERE account = ?", (account,)).fetchone()
+        return self._row_to_dict(row) if row else None
+
+    def upsert(self, account: str, **fields):
+        """原子地合并更新账号状态 (未给出的字段保持不变)"""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            current = self.get(account) or {}
+            current.update(fields)
+            current.pop("account", None)
+            extras = {k: v for k, v in current.items() if k not in COLUMNS}
+            self.conn.execute(
+                """
+                INSERT INTO accounts (account, expiry_time, next_check_time, next_check_ts,
+                                      status, error, last_check, extras)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (account) DO UPDATE SET
+                    expiry_time = excluded.expiry_time,
+                    next_check_time = excluded.next_check_time,
+                    next_check_ts = excluded.next_check_ts,
+                    status = excluded.status,
+                    error = excluded.error,
+                    last_check = excluded.last_check,
+                    extras = excluded.extras
+                """,
+                (
+                    account,
+                    current.get("expiry_time"),
+                    current.get("next_check_time"),
+                    to_timestamp(current.get("next_check_time")),
+                    current.get("status"),
+                    current.get("error"),
+                    current.get("last_check"),
+                    json.dumps(extras, ensure_ascii=False),
+                ),
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def accounts(self) -> List[Dict]:
+        rows = self.conn.execute("SELECT * FROM accounts ORDER BY next_check_ts IS NULL, next_check_ts")
+        return [self._row_to_dict(r) for r in rows]
+
+    def due_before(self, when: datetime.datetime) -> List[Dict]:
+        """下次检查时间早于 when 的账号 (含从未检查过的)"""
+        rows = self.conn.execute(
+            "SELECT * FROM accounts WHERE next_check_ts IS NULL OR next_check_ts <= ? "
+            "ORDER BY next_check_ts IS NULL, next_check_ts",
+            (when.timestamp(),),
+        )
+        return [self._row_to_dict(r) for r in rows]
+
+    # ---------- 运行历史 ----------
+    def record_run(self, account: str, started_at: str, finished_at: str, status: str,
+                   expiry_time: Optional[str] = None, next_check_time: Optional[str] = None,
+                   error: Optional[str] = None, record: Optional[Dict] = None):
+        self.conn.execute(
+            "INSERT INTO runs (account, started_at, finished_at, status, expiry_time, "
+            "next_check_time, error, record) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (account, started_at, finished_at, status, expiry_time, next_check_time, error,
+             json.dumps(record, ensure_ascii=False) if record is not None else None),
+        )
+
+    def history(self, account: Optional[str] = None, limit: int = 20) -> List[Dict]:
+        if account:
+            rows = self.conn.execute(
+                "SELECT * FROM runs WHERE account = ? ORDER BY started_at DESC LIMIT ?", (account, limit)
+            )
+        else:
+            rows = self.conn.execute("SELECT * FROM runs ORDER BY started_at DESC LIMIT ?", (limit,))
+        return [dict(r) for r in rows]
+
+    def close(self):
+        """合并 WAL 后关闭，仓库中只留下单个数据库文件"""
+        try:
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            self.conn.close()
+
+
+_stores: Dict[str, StateStore] = {}
+
+
+def get_store(path: Optional[str] = None) -> StateStore:
+    """进程内共享的存储实例"""
+    path = path or DEFAULT_PATH
+    if path not in _stores:
+        _stores[path] = StateStore(path)
+    return _stores[path]
+
+
+def close_all():
+    for store in _stores.values():
+        store.close()
+    _stores.clear()